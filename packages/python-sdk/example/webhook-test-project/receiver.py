@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import json
 import os
+from typing import Any, Dict
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
 from flask.typing import ResponseReturnValue
 
 from usesend import UseSend, WebhookVerificationError  # type: ignore[import-not-found]
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson is not installed
+    orjson = None  # type: ignore[assignment]
+
 
 WEBHOOK_SECRET = os.getenv("USESEND_WEBHOOK_SECRET", "whsec_test")
 
@@ -15,14 +22,23 @@ usesend = UseSend("us_test")
 webhooks = usesend.webhooks(WEBHOOK_SECRET)
 
 
+def _json(payload: Dict[str, Any], status: int = 200) -> Response:
+    # Serialize with orjson straight to bytes instead of flask.jsonify's
+    # pure-Python json.dumps; reuse this helper for any JSON response.
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload)
+    return Response(body, status=status, mimetype="application/json")
+
+
 @app.post("/webhook")
 def webhook() -> ResponseReturnValue:
-    raw_body = request.get_data()
+    # The body is consumed exactly once: read it as bytes without caching it
+    # on the request and hand those bytes straight to construct_event.
+    raw_body = request.get_data(cache=False, as_text=False)
 
     try:
         event = webhooks.construct_event(raw_body, headers=request.headers)
     except WebhookVerificationError as exc:
-        return jsonify({"ok": False, "code": exc.code, "message": str(exc)}), 400
+        return _json({"ok": False, "code": exc.code, "message": str(exc)}, 400)
 
     print(f"Received event: {event['type']}")
 
@@ -30,7 +46,7 @@ def webhook() -> ResponseReturnValue:
         bounce = event["data"].get("bounce", {})
         print("Bounce details:", bounce)
 
-    return jsonify({"ok": True, "type": event["type"]}), 200
+    return _json({"ok": True, "type": event["type"]})
 
 
 if __name__ == "__main__":
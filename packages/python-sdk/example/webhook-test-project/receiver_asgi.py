@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from usesend import UseSend, WebhookVerificationError  # type: ignore[import-not-found]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson is not installed
+    orjson = None  # type: ignore[assignment]
+
+
+WEBHOOK_SECRET = os.getenv("USESEND_WEBHOOK_SECRET", "whsec_test")
+
+usesend = UseSend("us_test")
+webhooks = usesend.webhooks(WEBHOOK_SECRET)
+
+
+def _json(payload: Dict[str, Any], status: int = 200) -> Response:
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload)
+    return Response(body, status_code=status, media_type="application/json")
+
+
+async def webhook(request: Request) -> Response:
+    # The raw body bytes go straight to construct_event, no decode step.
+    raw_body = await request.body()
+
+    try:
+        event = webhooks.construct_event(raw_body, headers=request.headers)
+    except WebhookVerificationError as exc:
+        return _json({"ok": False, "code": exc.code, "message": str(exc)}, 400)
+
+    print(f"Received event: {event['type']}")
+
+    if event["type"] == "email.bounced":
+        bounce = event["data"].get("bounce", {})
+        print("Bounce details:", bounce)
+
+    return _json({"ok": True, "type": event["type"]})
+
+
+app = Starlette(routes=[Route("/webhook", webhook, methods=["POST"])])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop="uvloop")
@@ -9,41 +9,55 @@ import uuid
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson is not installed
+    orjson = None  # type: ignore[assignment]
+
 
 WEBHOOK_SECRET = os.getenv("USESEND_WEBHOOK_SECRET", "whsec_test")
 WEBHOOK_URL = os.getenv("WEBHOOK_URL", "http://127.0.0.1:8000/webhook")
 
 
-def _signature(secret: str, timestamp_ms: str, body: str) -> str:
-    digest = hmac.new(
-        secret.encode("utf-8"),
-        f"{timestamp_ms}.{body}".encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    return f"v1={digest}"
+# Static event fields, built once; only the event id changes per send.
+PAYLOAD_TEMPLATE = {
+    "type": "email.bounced",
+    "createdAt": "2026-02-08T10:00:00.000Z",
+    "data": {
+        "id": "email_123",
+        "status": "BOUNCED",
+        "from": "sender@example.com",
+        "to": ["recipient@example.com"],
+        "occurredAt": "2026-02-08T10:00:00.000Z",
+        "bounce": {
+            "type": "Permanent",
+            "subType": "General",
+            "message": "Mailbox unavailable",
+        },
+    },
+}
+
+
+def _dumps(payload: dict) -> bytes:
+    """Encode compact UTF-8 JSON; both backends produce identical bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _signature(secret: str, timestamp_ms: str, body: bytes) -> str:
+    mac = hmac.new(secret.encode("utf-8"), None, hashlib.sha256)
+    mac.update(timestamp_ms.encode("utf-8"))
+    mac.update(b".")
+    mac.update(body)
+    return f"v1={mac.hexdigest()}"
 
 
 def main() -> None:
-    payload = {
-        "id": f"evt_{uuid.uuid4().hex[:8]}",
-        "type": "email.bounced",
-        "createdAt": "2026-02-08T10:00:00.000Z",
-        "data": {
-            "id": "email_123",
-            "status": "BOUNCED",
-            "from": "sender@example.com",
-            "to": ["recipient@example.com"],
-            "occurredAt": "2026-02-08T10:00:00.000Z",
-            "bounce": {
-                "type": "Permanent",
-                "subType": "General",
-                "message": "Mailbox unavailable",
-            },
-        },
-    }
+    payload = {"id": f"evt_{uuid.uuid4().hex[:8]}", **PAYLOAD_TEMPLATE}
 
-    body = json.dumps(payload)
-    timestamp = str(int(time.time() * 1000))
+    body = _dumps(payload)
+    timestamp = str(time.time_ns() // 1_000_000)
     signature = _signature(WEBHOOK_SECRET, timestamp, body)
 
     headers = {
@@ -1,6 +1,12 @@
+import json as json_module
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-from usesend import UseSend
+import pytest
+import requests
+
+from usesend import HttpxSession, UseSend, UseSendHTTPError, Urllib3Session
+from usesend.emails import _email_body
 
 
 class MockResponse:
@@ -37,6 +43,42 @@ class MockSession:
         return self._responses.pop(0)
 
 
+class BytesMockResponse(MockResponse):
+    """Response that also exposes the raw body, like ``requests.Response``."""
+
+    @property
+    def content(self) -> bytes:
+        return json_module.dumps(self._payload).encode("utf-8")
+
+
+class BytesMockSession(requests.Session):
+    """``requests.Session`` whose ``request`` records calls instead of sending."""
+
+    def __init__(self, responses: List[MockResponse]) -> None:
+        super().__init__()
+        self._responses = responses
+        self.calls: List[Dict[str, Any]] = []
+
+    def request(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Any] = None,
+        data: Optional[bytes] = None,
+    ) -> MockResponse:
+        self.calls.append(
+            {
+                "method": method,
+                "url": url,
+                "headers": headers,
+                "json": json if data is None else json_module.loads(data),
+                "data": data,
+            }
+        )
+        return self._responses.pop(0)
+
+
 def test_contact_books_list_uses_expected_path_and_returns_data() -> None:
     session = MockSession(
         [
@@ -136,3 +178,420 @@ def test_contacts_bulk_methods_use_expected_payloads() -> None:
     ]
     assert session.calls[1]["method"] == "DELETE"
     assert session.calls[1]["json"] == {"contactIds": ["ct_1", "ct_2"]}
+
+
+def test_emails_create_only_copies_payload_when_rewriting_fields() -> None:
+    session = MockSession(
+        [
+            MockResponse({"emailId": "email_1"}),
+            MockResponse({"emailId": "email_2"}),
+        ]
+    )
+    client = UseSend("us_test", session=session)
+    plain = {"to": "a@example.com", "from": "me@example.com", "subject": "Hi"}
+    scheduled = {
+        "to": "a@example.com",
+        "from_": "me@example.com",
+        "subject": "Hi",
+        "scheduledAt": datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc),
+    }
+
+    client.emails.create(plain)
+    client.emails.create(scheduled)
+
+    assert _email_body(plain) is plain
+    assert session.calls[0]["json"] == plain
+    assert session.calls[1]["json"] == {
+        "to": "a@example.com",
+        "from": "me@example.com",
+        "subject": "Hi",
+        "scheduledAt": "2026-03-01T10:00:00+00:00",
+    }
+    assert "from_" in scheduled
+
+
+@pytest.mark.parametrize(
+    "scheduled_at",
+    [
+        datetime(2026, 3, 1, 10, 0, 30, 123456),
+        datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc),
+        datetime(2026, 3, 1, 10, 0, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+    ],
+)
+def test_email_body_leaves_datetimes_to_orjson(scheduled_at: datetime) -> None:
+    pytest.importorskip("orjson")
+    from usesend.usesend import _encode_json
+
+    payload = {"to": "a@example.com", "scheduledAt": scheduled_at}
+
+    body = _email_body(payload)
+
+    assert body is payload
+    encoded = _encode_json(body)
+    assert encoded is not None
+    assert json_module.loads(encoded)["scheduledAt"] == scheduled_at.isoformat()
+
+
+def test_email_body_converts_datetimes_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    from usesend import _jsonlib
+
+    monkeypatch.setattr(_jsonlib, "_orjson", None)
+    scheduled_at = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+    payload = {"to": "a@example.com", "scheduledAt": scheduled_at}
+
+    body = _email_body(payload)
+
+    assert body is not payload
+    assert body["scheduledAt"] == scheduled_at.isoformat()
+    assert payload["scheduledAt"] is scheduled_at
+
+
+def test_email_body_converts_offsets_with_seconds() -> None:
+    scheduled_at = datetime(2026, 3, 1, 10, 0, tzinfo=timezone(timedelta(seconds=30)))
+    payload = {"to": "a@example.com", "scheduledAt": scheduled_at}
+
+    body = _email_body(payload)
+
+    assert body is not payload
+    assert body["scheduledAt"] == "2026-03-01T10:00:00+00:00:30"
+
+
+def test_emails_batch_normalizes_each_item() -> None:
+    session = MockSession([MockResponse({"data": [{"id": "email_1"}, {"id": "email_2"}]})])
+    client = UseSend("us_test", session=session)
+    first = {"to": "a@example.com", "from": "me@example.com", "subject": "Hi"}
+
+    client.emails.batch(
+        [first, {"to": "b@example.com", "from_": "me@example.com", "subject": "Hi"}]
+    )
+
+    sent = session.calls[0]["json"]
+    assert sent[0] == first
+    assert sent[1] == {"to": "b@example.com", "from": "me@example.com", "subject": "Hi"}
+
+
+def test_post_sends_pre_encoded_bytes_unchanged() -> None:
+    session = BytesMockSession([MockResponse({"ok": True})])
+    client = UseSend("us_test", session=session)
+    body = b'[{"to":"a@example.com"}]'
+
+    client.post("/emails/batch", body)
+
+    assert session.calls[0]["data"] is body
+
+
+def test_requests_sessions_receive_encoded_bodies_and_raw_responses() -> None:
+    session = BytesMockSession([BytesMockResponse({"emailId": "email_1"})])
+    client = UseSend("us_test", session=session)
+
+    data, err = client.emails.send({"to": "a@example.com", "from": "me@example.com"})
+
+    assert (data, err) == ({"emailId": "email_1"}, None)
+    assert isinstance(session.calls[0]["data"], (bytes, type(None)))
+    assert session.calls[0]["json"] == {"to": "a@example.com", "from": "me@example.com"}
+
+
+def test_undecodable_success_body_returns_default_error() -> None:
+    class TextResponse(MockResponse):
+        def json(self) -> Dict[str, Any]:
+            raise ValueError("not JSON")
+
+    client = UseSend("us_test", session=MockSession([TextResponse({}, reason="OK")]))
+
+    assert client.domains.list() == (None, {"code": "INTERNAL_SERVER_ERROR", "message": "OK"})
+
+
+def test_error_responses_fall_back_to_default_error() -> None:
+    session = MockSession(
+        [
+            MockResponse({"error": {"code": "NOT_FOUND", "message": "Missing"}}, ok=False),
+            MockResponse({}, ok=False, reason="Bad Request"),
+        ]
+    )
+    client = UseSend("us_test", session=session, raise_on_error=False)
+
+    _, not_found = client.emails.get("email_123")
+    _, fallback = client.emails.get("email_456")
+
+    assert not_found == {"code": "NOT_FOUND", "message": "Missing"}
+    assert fallback == {"code": "INTERNAL_SERVER_ERROR", "message": "Bad Request"}
+
+
+def test_clients_without_session_share_pooled_default_session() -> None:
+    first = UseSend("us_first")
+    second = UseSend("us_second")
+
+    assert first._session is second._session
+    adapter = first._session.get_adapter("https://app.usesend.com")
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert first._build_headers()["Authorization"] == "Bearer us_first"
+    assert second._build_headers()["Authorization"] == "Bearer us_second"
+
+
+def test_default_session_does_not_persist_cookies() -> None:
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    from usesend.usesend import _build_default_session
+
+    seen_cookies: List[Optional[str]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            seen_cookies.append(self.headers.get("Cookie"))
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = _build_default_session()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        first = UseSend("us_first", url=url, session=session)
+        second = UseSend("us_second", url=url, session=session)
+
+        assert first.domains.list() == ({}, None)
+        assert second.domains.list() == ({}, None)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert seen_cookies == [None, None]
+    assert len(session.cookies) == 0
+
+
+def test_build_headers_only_copies_when_merging_extras() -> None:
+    client = UseSend("us_test", session=MockSession([]))
+
+    assert client._build_headers() is client.headers
+    merged = client._build_headers({"Idempotency-Key": "key_1"})
+    assert merged["Idempotency-Key"] == "key_1"
+    assert "Idempotency-Key" not in client.headers
+
+
+class MockPoolManager:
+    def __init__(self, status: int, data: bytes, reason: str = "OK") -> None:
+        self._status = status
+        self._data = data
+        self._reason = reason
+        self.calls: List[Dict[str, Any]] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        self.calls.append({"method": method, "url": url, "body": body, "headers": headers})
+        return type("Resp", (), {"status": self._status, "reason": self._reason, "data": self._data})()
+
+
+def test_urllib3_session_sends_json_and_parses_response() -> None:
+    pool = MockPoolManager(200, b'{"emailId": "email_1"}')
+    client = UseSend("us_test", session=Urllib3Session(pool))  # type: ignore[arg-type]
+
+    data, err = client.emails.send({"to": "a@example.com", "from": "me@example.com"})
+
+    assert err is None
+    assert data == {"emailId": "email_1"}
+    assert pool.calls[0]["method"] == "POST"
+    assert pool.calls[0]["url"].endswith("/api/v1/emails")
+    assert json_module.loads(pool.calls[0]["body"]) == {
+        "to": "a@example.com",
+        "from": "me@example.com",
+    }
+    assert pool.calls[0]["headers"]["Authorization"] == "Bearer us_test"
+
+
+def test_urllib3_session_surfaces_api_errors() -> None:
+    pool = MockPoolManager(
+        404, b'{"error": {"code": "NOT_FOUND", "message": "Missing"}}', reason="Not Found"
+    )
+    client = UseSend("us_test", session=Urllib3Session(pool), raise_on_error=False)  # type: ignore[arg-type]
+
+    data, err = client.emails.get("email_123")
+
+    assert data is None
+    assert err == {"code": "NOT_FOUND", "message": "Missing"}
+
+
+class MockHttpxClient:
+    def __init__(self, status: int, content: bytes, reason: str = "OK") -> None:
+        self._status = status
+        self._content = content
+        self._reason = reason
+        self.calls: List[Dict[str, Any]] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> Any:
+        self.calls.append({"method": method, "url": url, "content": content, "headers": headers})
+        return type(
+            "Resp",
+            (),
+            {"status_code": self._status, "reason_phrase": self._reason, "content": self._content},
+        )()
+
+
+def test_httpx_session_sends_json_and_parses_response() -> None:
+    http = MockHttpxClient(200, b'{"emailId": "email_1"}')
+    client = UseSend("us_test", session=HttpxSession(http))  # type: ignore[arg-type]
+
+    data, err = client.emails.send({"to": "a@example.com", "from": "me@example.com"})
+
+    assert err is None
+    assert data == {"emailId": "email_1"}
+    assert http.calls[0]["method"] == "POST"
+    assert json_module.loads(http.calls[0]["content"]) == {
+        "to": "a@example.com",
+        "from": "me@example.com",
+    }
+    assert http.calls[0]["headers"]["Authorization"] == "Bearer us_test"
+
+
+def test_contacts_iter_list_pages_until_short_page() -> None:
+    session = MockSession(
+        [
+            MockResponse([{"id": "ct_1"}, {"id": "ct_2"}]),
+            MockResponse([{"id": "ct_3"}]),
+        ]
+    )
+    client = UseSend("us_test", session=session, raise_on_error=False)
+
+    contacts = list(client.contacts.iter_list("cb_123", emails="a@example.com", limit=2))
+
+    assert [c["id"] for c in contacts] == ["ct_1", "ct_2", "ct_3"]
+    assert session.calls[0]["url"].endswith(
+        "/api/v1/contactBooks/cb_123/contacts?emails=a%40example.com&limit=2&page=1"
+    )
+    assert session.calls[1]["url"].endswith("&limit=2&page=2")
+
+
+def test_contacts_iter_list_raises_on_error() -> None:
+    session = MockSession([MockResponse({"error": {"code": "NOT_FOUND", "message": "x"}}, ok=False)])
+    client = UseSend("us_test", session=session, raise_on_error=False)
+
+    with pytest.raises(UseSendHTTPError):
+        list(client.contacts.iter_list("cb_missing"))
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_contacts_iter_list_rejects_non_positive_limit(limit: int) -> None:
+    session = MockSession([])
+    client = UseSend("us_test", session=session)
+
+    with pytest.raises(ValueError):
+        client.contacts.iter_list("cb_123", limit=limit)
+    assert session.calls == []
+
+
+def test_resource_method_annotations_resolve() -> None:
+    from typing import get_type_hints
+
+    from usesend.contacts import Contacts
+    from usesend.emails import Emails
+    from usesend.webhooks import Webhooks
+
+    assert "payload" in get_type_hints(Emails.create)
+    assert "return" in get_type_hints(Contacts.create)
+    assert "return" in get_type_hints(Webhooks.construct_event)
+
+
+def test_resource_classes_importable_from_client_module() -> None:
+    from usesend import campaigns, contact_books, contacts, domains, emails, webhooks
+    from usesend.usesend import Campaigns, ContactBooks, Contacts, Domains, Emails, Webhooks
+
+    assert Campaigns is campaigns.Campaigns
+    assert ContactBooks is contact_books.ContactBooks
+    assert Contacts is contacts.Contacts
+    assert Domains is domains.Domains
+    assert Emails is emails.Emails
+    assert Webhooks is webhooks.Webhooks
+
+
+def test_resource_and_webhook_methods_can_be_patched() -> None:
+    from unittest import mock
+
+    client = UseSend("us_test", session=MockSession([]))
+    webhooks = client.webhooks("whsec_test")
+
+    with mock.patch.object(client.emails, "send", return_value=({"emailId": "e"}, None)):
+        assert client.emails.send({"to": "a@example.com"}) == ({"emailId": "e"}, None)
+    with mock.patch.object(webhooks, "verify", return_value=True):
+        assert webhooks.verify("{}", headers={}) is True
+
+
+class EchoSession:
+    """Thread-safe session echoing the request; paths containing 'fail' error."""
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Any] = None,
+        data: Optional[bytes] = None,
+    ) -> MockResponse:
+        if "fail" in url:
+            return MockResponse({"error": {"code": "BAD_REQUEST", "message": url}}, ok=False)
+        return MockResponse({"method": method, "url": url})
+
+
+def test_execute_many_returns_results_in_input_order() -> None:
+    client = UseSend("us_test", session=EchoSession())  # type: ignore[arg-type]
+
+    results = client.execute_many(
+        [
+            ("GET", "/domains"),
+            ("POST", "/contactBooks/cb_123/contacts", {"email": "a@example.com"}),
+            ("DELETE", "/contactBooks/cb_123/contacts/ct_1"),
+        ]
+    )
+
+    assert [(data["method"], data["url"].split("/api/v1")[1]) for data, _ in results] == [
+        ("GET", "/domains"),
+        ("POST", "/contactBooks/cb_123/contacts"),
+        ("DELETE", "/contactBooks/cb_123/contacts/ct_1"),
+    ]
+    assert all(err is None for _, err in results)
+
+
+def test_execute_many_reports_failures_without_dropping_other_calls() -> None:
+    client = UseSend("us_test", session=EchoSession())  # type: ignore[arg-type]
+    calls = [("POST", "/emails/fail", {"to": "a@example.com"})] + [
+        ("POST", "/emails", {"to": f"user{i}@example.com"}) for i in range(6)
+    ]
+
+    results = client.execute_many(calls, max_workers=2)
+
+    assert len(results) == 7
+    data, err = results[0]
+    assert data is None
+    assert err is not None and err["code"] == "BAD_REQUEST"
+    assert all(data is not None and err is None for data, err in results[1:])
+
+
+def test_http_error_exposes_fields_and_message() -> None:
+    session = MockSession([MockResponse({"error": {"code": "NOT_FOUND", "message": "Missing"}}, ok=False)])
+    client = UseSend("us_test", session=session)
+
+    with pytest.raises(UseSendHTTPError) as exc:
+        client.emails.get("email_123")
+
+    assert exc.value.status_code == 400
+    assert exc.value.error["code"] == "NOT_FOUND"
+    assert str(exc.value) == "GET /emails/email_123 -> 400 NOT_FOUND: Missing"
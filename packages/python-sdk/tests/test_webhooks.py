@@ -2,7 +2,7 @@ import hashlib
 import hmac
 import json
 import time
-from typing import get_args, get_type_hints
+from typing import Any, List, Optional, get_args, get_type_hints
 
 import pytest
 
@@ -16,12 +16,11 @@ from usesend.webhooks import (
 
 
 def _sign(secret: str, timestamp: str, body: str) -> str:
-    digest = hmac.new(
-        secret.encode("utf-8"),
-        f"{timestamp}.{body}".encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    return f"v1={digest}"
+    mac = hmac.new(secret.encode("utf-8"), None, hashlib.sha256)
+    mac.update(timestamp.encode("utf-8"))
+    mac.update(b".")
+    mac.update(body.encode("utf-8"))
+    return f"v1={mac.hexdigest()}"
 
 
 def test_verify_returns_false_for_non_utf8_bytes_body() -> None:
@@ -101,3 +100,251 @@ def test_construct_event_parses_bounced_event_with_valid_signature() -> None:
 
     assert event["type"] == "email.bounced"
     assert event["data"]["bounce"]["type"] == "Permanent"
+
+
+def test_verify_accepts_raw_bytes_body() -> None:
+    secret = "whsec_test"
+    webhooks = Webhooks(secret)
+    timestamp = str(int(time.time() * 1000))
+    body = json.dumps({"id": "evt_123", "type": "email.delivered", "data": {"to": "é"}})
+
+    is_valid = webhooks.verify(
+        body.encode("utf-8"),
+        headers={
+            WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, body),
+            WEBHOOK_TIMESTAMP_HEADER: timestamp,
+        },
+    )
+
+    assert is_valid is True
+
+
+def test_verify_supports_secret_override_and_repeated_calls() -> None:
+    webhooks = Webhooks("whsec_default")
+    timestamp = str(int(time.time() * 1000))
+    body = '{"id":"evt_123","type":"webhook.test"}'
+    headers = {
+        WEBHOOK_SIGNATURE_HEADER: _sign("whsec_default", timestamp, body),
+        WEBHOOK_TIMESTAMP_HEADER: timestamp,
+    }
+    override_headers = {
+        WEBHOOK_SIGNATURE_HEADER: _sign("whsec_other", timestamp, body),
+        WEBHOOK_TIMESTAMP_HEADER: timestamp,
+    }
+
+    assert webhooks.verify(body, headers=headers) is True
+    assert webhooks.verify(body, headers=headers) is True
+    assert webhooks.verify(body, headers=override_headers) is False
+    assert webhooks.verify(body, headers=override_headers, secret="whsec_other") is True
+
+
+def test_construct_event_rejects_malformed_signature_hex() -> None:
+    webhooks = Webhooks("whsec_test")
+    timestamp = str(int(time.time() * 1000))
+
+    for signature in ("v1=deadbeef", "v1=" + "zz" * 32):
+        with pytest.raises(WebhookVerificationError) as exc:
+            webhooks.construct_event(
+                "{}",
+                headers={
+                    WEBHOOK_SIGNATURE_HEADER: signature,
+                    WEBHOOK_TIMESTAMP_HEADER: timestamp,
+                },
+            )
+
+        assert exc.value.code == "SIGNATURE_MISMATCH"
+
+
+def test_verify_reads_headers_case_insensitively() -> None:
+    secret = "whsec_test"
+    webhooks = Webhooks(secret)
+    timestamp = str(int(time.time() * 1000))
+    body = '{"id":"evt_123","type":"webhook.test"}'
+
+    is_valid = webhooks.verify(
+        body,
+        headers={
+            WEBHOOK_SIGNATURE_HEADER.lower(): [_sign(secret, timestamp, body)],
+            WEBHOOK_TIMESTAMP_HEADER.upper(): timestamp,
+        },
+    )
+
+    assert is_valid is True
+
+
+def test_verify_rejects_stale_timestamp_using_instance_tolerance() -> None:
+    secret = "whsec_test"
+    webhooks = Webhooks(secret, tolerance=1000)
+    timestamp = str(int(time.time() * 1000) - 60_000)
+    body = '{"id":"evt_123","type":"webhook.test"}'
+    headers = {
+        WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, body),
+        WEBHOOK_TIMESTAMP_HEADER: timestamp,
+    }
+
+    with pytest.raises(WebhookVerificationError) as exc:
+        webhooks.construct_event(body, headers=headers)
+
+    assert exc.value.code == "TIMESTAMP_OUT_OF_RANGE"
+    assert webhooks.verify(body, headers=headers, tolerance=-1) is True
+
+
+def test_construct_event_parses_bytes_body() -> None:
+    secret = "whsec_test"
+    webhooks = Webhooks(secret)
+    timestamp = str(int(time.time() * 1000))
+    body = json.dumps(
+        {"id": "evt_123", "type": "email.delivered", "data": {"to": ["ü@example.com"]}},
+        ensure_ascii=False,
+    )
+
+    event = webhooks.construct_event(
+        body.encode("utf-8"),
+        headers={
+            WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, body),
+            WEBHOOK_TIMESTAMP_HEADER: timestamp,
+        },
+    )
+
+    assert event["data"]["to"] == ["ü@example.com"]
+
+
+def test_webhook_event_type_sets_match_literals() -> None:
+    email_event_type = get_type_hints(types.EmailWebhookEvent)["type"]
+
+    assert types.EMAIL_BASE_WEBHOOK_EVENT_TYPES == frozenset(get_args(email_event_type))
+    assert types.EMAIL_BASE_WEBHOOK_EVENT_TYPES < types.WEBHOOK_EVENT_TYPES
+    assert "webhook.test" in types.WEBHOOK_EVENT_TYPES
+
+
+def test_verify_batch_returns_result_per_item() -> None:
+    secret = "whsec_test"
+    webhooks = Webhooks(secret)
+    timestamp = str(int(time.time() * 1000))
+    body = '{"id":"evt_123","type":"webhook.test"}'
+    valid_headers = {
+        WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, body),
+        WEBHOOK_TIMESTAMP_HEADER: timestamp,
+    }
+
+    results = webhooks.verify_batch(
+        [
+            (body, valid_headers),
+            (body.encode("utf-8"), valid_headers),
+            (body + " ", valid_headers),
+            (body, {WEBHOOK_TIMESTAMP_HEADER: timestamp}),
+        ]
+    )
+
+    assert results == [True, True, False, False]
+
+
+def test_verify_batch_checks_each_timestamp_when_consumed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    secret = "whsec_test"
+    webhooks = Webhooks(secret, tolerance=1000)
+    body = '{"id":"evt_123","type":"webhook.test"}'
+    clock = {"ms": 1_700_000_000_000}
+    monkeypatch.setattr(time, "time_ns", lambda: clock["ms"] * 1_000_000)
+
+    def deliveries():
+        for _ in range(2):
+            timestamp = str(clock["ms"])
+            yield body, {
+                WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, body),
+                WEBHOOK_TIMESTAMP_HEADER: timestamp,
+            }
+            # The next delivery arrives long after the batch started.
+            clock["ms"] += 60_000
+
+    assert webhooks.verify_batch(deliveries()) == [True, True]
+
+
+def test_secret_overrides_are_cached_per_instance_and_bounded() -> None:
+    timestamp = str(int(time.time() * 1000))
+    body = '{"id":"evt_123","type":"webhook.test"}'
+    webhooks = Webhooks("whsec_test")
+    secrets = [f"whsec_endpoint_{i}" for i in range(10)]
+
+    for secret in secrets:
+        headers = {
+            WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, body),
+            WEBHOOK_TIMESTAMP_HEADER: timestamp,
+        }
+        assert webhooks.verify(body, headers=headers, secret=secret) is True
+
+    assert len(webhooks._override_macs) < len(secrets)
+    assert Webhooks("whsec_test")._override_macs == {}
+
+
+def test_verify_cache_requires_matching_body() -> None:
+    secret = "whsec_test"
+    webhooks = Webhooks(secret, cache_size=1)
+    timestamp = str(int(time.time() * 1000))
+    body = '{"id":"evt_123","type":"webhook.test"}'
+    other_body = '{"id":"evt_456","type":"webhook.test"}'
+    headers = {
+        WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, body),
+        WEBHOOK_TIMESTAMP_HEADER: timestamp,
+    }
+    other_headers = {
+        WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, other_body),
+        WEBHOOK_TIMESTAMP_HEADER: timestamp,
+    }
+
+    assert webhooks.verify(body, headers=headers) is True
+    assert webhooks.verify(body, headers=headers) is True
+    assert webhooks.verify(other_body, headers=headers) is False
+    assert webhooks.verify(body, headers=headers, secret="whsec_other") is False
+    assert webhooks.verify(other_body, headers=other_headers) is True
+    assert webhooks.verify(body, headers=headers) is True
+
+
+@pytest.mark.parametrize("cache_size, expected_calls", [(None, 2), (1, 1)])
+def test_verify_cache_skips_hmac_on_hit(
+    monkeypatch: pytest.MonkeyPatch, cache_size: Optional[int], expected_calls: int
+) -> None:
+    from usesend import webhooks as webhooks_module
+
+    calls: List[str] = []
+    original = webhooks_module._compute_signature
+
+    def counting(mac: Any, timestamp: str, body: bytes) -> bytes:
+        calls.append(timestamp)
+        return original(mac, timestamp, body)
+
+    monkeypatch.setattr(webhooks_module, "_compute_signature", counting)
+
+    secret = "whsec_test"
+    if cache_size is None:
+        webhooks = Webhooks(secret)
+    else:
+        webhooks = Webhooks(secret, cache_size=cache_size)
+    timestamp = str(int(time.time() * 1000))
+    body = '{"id":"evt_123","type":"webhook.test"}'
+    headers = {
+        WEBHOOK_SIGNATURE_HEADER: _sign(secret, timestamp, body),
+        WEBHOOK_TIMESTAMP_HEADER: timestamp,
+    }
+
+    assert webhooks.verify(body, headers=headers) is True
+    assert webhooks.verify(body, headers=headers) is True
+    assert len(calls) == expected_calls
+
+
+def test_verify_reads_lowercase_and_case_insensitive_headers() -> None:
+    from requests.structures import CaseInsensitiveDict
+
+    secret = "whsec_test"
+    webhooks = Webhooks(secret)
+    timestamp = str(int(time.time() * 1000))
+    body = '{"id":"evt_123","type":"webhook.test"}'
+    lowercase = {
+        "content-type": "application/json",
+        WEBHOOK_SIGNATURE_HEADER.lower(): _sign(secret, timestamp, body),
+        WEBHOOK_TIMESTAMP_HEADER.lower(): timestamp,
+    }
+
+    assert webhooks.verify(body, headers=lowercase) is True
+    assert webhooks.verify(body, headers=CaseInsensitiveDict(lowercase)) is True
@@ -1,6 +1,7 @@
 """Python client for the UseSend API."""
 
 from .usesend import UseSend, UseSendHTTPError
+from .transport import HttpxSession, Urllib3Session
 from .contacts import Contacts  # type: ignore
 from .contact_books import ContactBooks  # type: ignore
 from .domains import Domains  # type: ignore
@@ -18,6 +19,8 @@ from . import types
 __all__ = [
     "UseSend",
     "UseSendHTTPError",
+    "Urllib3Session",
+    "HttpxSession",
     "types",
     "Contacts",
     "ContactBooks",
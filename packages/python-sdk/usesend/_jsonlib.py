@@ -0,0 +1,36 @@
+"""JSON encoding and decoding shared by the client, transports and webhooks.
+
+Uses ``orjson`` when it is installed (``pip install "usesend[orjson]"``) and
+the standard library otherwise.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:  # Optional fast JSON backend
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _orjson = None
+
+
+def has_orjson() -> bool:
+    """Whether ``orjson`` is available.
+
+    When it is, :func:`dumps` also serializes ``datetime`` values itself.
+    """
+    return _orjson is not None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from text or raw bytes."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
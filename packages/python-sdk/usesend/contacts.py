@@ -1,7 +1,7 @@
 """Contact resource client using TypedDict shapes (no Pydantic)."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 from urllib.parse import urlencode
 
 from .types import (
@@ -13,6 +13,7 @@ from .types import (
     ContactBulkDelete,
     ContactBulkDeleteResponse,
     ContactList,
+    ContactListItem,
     ContactUpdate,
     ContactUpdateResponse,
     ContactUpsert,
@@ -22,6 +23,10 @@ from .types import (
 )
 
 
+# Page size used by :meth:`Contacts.iter_list`
+DEFAULT_PAGE_SIZE = 500
+
+
 class Contacts:
     """Client for `/contactBooks` endpoints."""
 
@@ -63,6 +68,46 @@ class Contacts:
         data, err = self.usesend.get(path)
         return (data, err)  # type: ignore[return-value]
 
+    def iter_list(
+        self,
+        book_id: str,
+        *,
+        emails: Optional[str] = None,
+        ids: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[ContactListItem]:
+        """Iterate over every matching contact, fetching one page at a time.
+
+        Only one page of ``limit`` contacts is held in memory, which keeps
+        exports of large contact books flat in memory. Failed requests raise
+        :class:`UseSendHTTPError` regardless of ``raise_on_error``.
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        query: Dict[str, Any] = {}
+        if emails is not None:
+            query["emails"] = emails
+        if ids is not None:
+            query["ids"] = ids
+        query["limit"] = limit
+        return self._iter_pages(f"/contactBooks/{book_id}/contacts", query, limit)
+
+    def _iter_pages(
+        self, path: str, query: Dict[str, Any], limit: int
+    ) -> Iterator[ContactListItem]:
+        page = 1
+        while True:
+            query["page"] = page
+            data, _ = self.usesend._request(
+                "GET", f"{path}?{urlencode(query)}", raise_on_error=True
+            )
+            rows = data or []
+            yield from rows  # type: ignore[misc]
+            if len(rows) < limit:
+                return
+            page += 1
+
     def get(
         self, book_id: str, contact_id: str
     ) -> Tuple[Optional[Contact], Optional[APIError]]:
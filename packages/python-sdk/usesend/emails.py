@@ -1,10 +1,11 @@
 """Email resource client using TypedDict shapes (no Pydantic)."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from typing_extensions import TypedDict
 
+from ._jsonlib import has_orjson
 from .types import (
     APIError,
     Attachment,
@@ -24,6 +25,50 @@ class EmailOptions(TypedDict, total=False):
     idempotency_key: Optional[str]
 
 
+def _email_body(payload: Any) -> Dict[str, Any]:
+    """Return the JSON body for an email payload.
+
+    The payload is only copied when a field needs rewriting (``from_`` alias,
+    ``datetime`` ``scheduledAt`` the encoder can't handle); otherwise the
+    caller's dict is sent as-is and must not be mutated until the call
+    returns.
+    """
+    rename_from = "from_" in payload and "from" not in payload
+    scheduled_at = payload.get("scheduledAt")
+    convert_scheduled_at = isinstance(scheduled_at, datetime) and not _encodes_natively(
+        scheduled_at
+    )
+    if isinstance(payload, dict) and not rename_from and not convert_scheduled_at:
+        return payload
+
+    body: Dict[str, Any] = dict(payload)
+    # Support accidental 'from_' usage
+    if rename_from:
+        body["from"] = body.pop("from_")
+    # Convert scheduledAt to ISO 8601 if datetime
+    if isinstance(scheduled_at, datetime):
+        body["scheduledAt"] = scheduled_at.isoformat()
+    return body
+
+
+def _encodes_natively(value: datetime) -> bool:
+    """Whether the request encoder emits ``value.isoformat()`` by itself.
+
+    orjson serializes plain ``datetime`` objects with no or stdlib
+    ``timezone`` tzinfo to the same ISO 8601 string, as long as the UTC
+    offset is a whole number of minutes (it rounds away offset seconds).
+    Anything else still goes through ``isoformat()``.
+    """
+    if not has_orjson() or type(value) is not datetime:
+        return False
+    if value.tzinfo is None:
+        return True
+    if not isinstance(value.tzinfo, timezone):
+        return False
+    offset = value.utcoffset()
+    return offset is not None and offset % timedelta(minutes=1) == timedelta(0)
+
+
 def _idem_headers(idempotency_key: Optional[str]) -> Optional[Dict[str, str]]:
     if idempotency_key:
         return {"Idempotency-Key": idempotency_key}
@@ -50,17 +95,7 @@ class Emails:
         payload: Union[EmailCreate, Dict[str, Any]],
         options: Optional[EmailOptions] = None,
     ) -> Tuple[Optional[EmailCreateResponse], Optional[APIError]]:
-        if isinstance(payload, dict):
-            payload = dict(payload)
-
-        # Normalize fields
-        body: Dict[str, Any] = dict(payload)
-        # Support accidental 'from_' usage
-        if "from_" in body and "from" not in body:
-            body["from"] = body.pop("from_")
-        # Convert scheduledAt to ISO 8601 if datetime
-        if isinstance(body.get("scheduledAt"), datetime):
-            body["scheduledAt"] = body["scheduledAt"].isoformat()
+        body = _email_body(payload)
 
         idempotency_key = options.get("idempotency_key") if options else None
         data, err = self.usesend.post(
@@ -73,14 +108,7 @@ class Emails:
         payload: Sequence[Union[EmailBatchItem, Dict[str, Any]]],
         options: Optional[EmailOptions] = None,
     ) -> Tuple[Optional[EmailBatchResponse], Optional[APIError]]:
-        items: List[Dict[str, Any]] = []
-        for item in payload:
-            d = dict(item)
-            if "from_" in d and "from" not in d:
-                d["from"] = d.pop("from_")
-            if isinstance(d.get("scheduledAt"), datetime):
-                d["scheduledAt"] = d["scheduledAt"].isoformat()
-            items.append(d)
+        items: List[Dict[str, Any]] = [_email_body(item) for item in payload]
         idempotency_key = options.get("idempotency_key") if options else None
         data, err = self.usesend.post(
             "/emails/batch", items, headers=_idem_headers(idempotency_key)
@@ -92,9 +120,7 @@ class Emails:
         return (data, err)  # type: ignore[return-value]
 
     def update(self, email_id: str, payload: EmailUpdate) -> Tuple[Optional[EmailUpdateResponse], Optional[APIError]]:
-        body: Dict[str, Any] = dict(payload)
-        if isinstance(body.get("scheduledAt"), datetime):
-            body["scheduledAt"] = body["scheduledAt"].isoformat()
+        body = _email_body(payload)
 
         data, err = self.usesend.patch(f"/emails/{email_id}", body)
         return (data, err)  # type: ignore[return-value]
@@ -0,0 +1,169 @@
+"""Lightweight ``urllib3`` transport usable in place of ``requests.Session``.
+
+``UseSend`` only needs ``session.request(method, url, headers=..., json=...,
+data=...)`` returning an object with ``ok``, ``status_code``, ``reason`` and
+``json()``. ``Urllib3Session`` provides exactly that on top of a pooled
+``urllib3.PoolManager``, skipping the request preparation, hook dispatch and
+cookie/environment merging that ``requests`` performs on every call.
+``HttpxSession`` does the same over an ``httpx.Client`` with HTTP/2 enabled,
+so concurrent calls (e.g. ``UseSend.execute_many``) share one multiplexed
+connection instead of one pooled connection each.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import urllib3
+from urllib3.util.retry import Retry
+
+from ._jsonlib import dumps, loads
+
+if TYPE_CHECKING:
+    import httpx
+
+
+# Connection pool size used by the default transports
+DEFAULT_POOL_SIZE = 10
+
+
+def default_retry() -> Retry:
+    """Retry policy shared by the default transports.
+
+    Only idempotent methods are retried on 429/5xx so a retried ``POST`` can
+    never send an email twice; the last response is returned, not raised.
+    """
+    return Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+
+
+class _Response:
+    """Minimal response object mirroring the parts of ``requests.Response`` used.
+
+    Shared by the transports in this module.
+    """
+
+    __slots__ = ("status_code", "reason", "content")
+
+    def __init__(self, status_code: int, reason: Optional[str], content: bytes) -> None:
+        self.status_code = status_code
+        self.reason = reason or ""
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        return loads(self.content)
+
+
+class Urllib3Session:
+    """``requests.Session`` stand-in backed by ``urllib3.PoolManager``.
+
+    Parameters
+    ----------
+    pool_manager:
+        Optional preconfigured ``urllib3.PoolManager`` to use.
+    maxsize:
+        Connections kept alive per host when no pool manager is given.
+
+    Unlike ``requests.Session``, network failures raise urllib3's own
+    exceptions (e.g. ``urllib3.exceptions.MaxRetryError``), not
+    ``requests.exceptions.RequestException``. Like ``requests``, no timeout
+    is applied by default; pass a pool manager built with ``timeout=`` to
+    bound requests.
+
+    Example
+    -------
+    ```python
+    from usesend import UseSend, Urllib3Session
+
+    client = UseSend("us_12345", session=Urllib3Session())
+    ```
+    """
+
+    def __init__(
+        self,
+        pool_manager: Optional[urllib3.PoolManager] = None,
+        *,
+        maxsize: int = DEFAULT_POOL_SIZE,
+    ) -> None:
+        self._pool = pool_manager or urllib3.PoolManager(
+            maxsize=maxsize,
+            retries=default_retry(),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Any] = None,
+        data: Optional[bytes] = None,
+    ) -> _Response:
+        if data is None and json is not None:
+            data = dumps(json)
+        resp = self._pool.request(method, url, body=data, headers=headers)
+        return _Response(resp.status, resp.reason, resp.data)
+
+
+class HttpxSession:
+    """``requests.Session`` stand-in backed by an HTTP/2 ``httpx.Client``.
+
+    Requires the ``http2`` extra (``pip install "usesend[http2]"``).
+
+    Parameters
+    ----------
+    client:
+        Optional preconfigured ``httpx.Client`` to use.
+    retries:
+        Connection retries for the default client's transport.
+
+    Network failures raise ``httpx`` exceptions (e.g.
+    ``httpx.ConnectError``), not ``requests.exceptions.RequestException``,
+    and the default client uses httpx's 5 second timeout.
+
+    Example
+    -------
+    ```python
+    from usesend import UseSend, HttpxSession
+
+    client = UseSend("us_12345", session=HttpxSession())
+    ```
+    """
+
+    def __init__(self, client: Optional["httpx.Client"] = None, *, retries: int = 3) -> None:
+        if client is None:
+            try:
+                import httpx
+            except ImportError as exc:  # pragma: no cover - depends on environment
+                raise ImportError(
+                    'HttpxSession requires httpx; install "usesend[http2]"'
+                ) from exc
+            client = httpx.Client(
+                transport=httpx.HTTPTransport(http2=True, retries=retries),
+            )
+        self._client = client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Any] = None,
+        data: Optional[bytes] = None,
+    ) -> _Response:
+        if data is None and json is not None:
+            data = dumps(json)
+        resp = self._client.request(method, url, headers=headers, content=data)
+        return _Response(resp.status_code, resp.reason_phrase, resp.content)
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._client.close()
@@ -7,7 +7,7 @@ At runtime these are plain dicts and lists.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, TypedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Union, TypedDict, get_args
 from typing_extensions import NotRequired, Required, Literal
 
 # ---------------------------------------------------------------------------
@@ -940,3 +940,11 @@ WebhookEventData = Union[
     DomainWebhookEvent,
     WebhookTestEvent,
 ]
+
+
+# Runtime sets of event type literals, computed once at import so callers can
+# check ``event["type"]`` membership without reflecting on the types above.
+WEBHOOK_EVENT_TYPES: FrozenSet[str] = frozenset(get_args(WebhookEventType))
+EMAIL_BASE_WEBHOOK_EVENT_TYPES: FrozenSet[str] = frozenset(
+    get_args(EmailBaseWebhookEventType)
+)
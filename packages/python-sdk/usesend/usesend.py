@@ -2,34 +2,78 @@
 
 Enhancements:
 - Optional ``raise_on_error`` to raise ``UseSendHTTPError`` on non-2xx.
-- Reusable ``requests.Session`` support for connection reuse.
+- Reusable ``requests.Session`` support for connection reuse; clients that
+  don't pass one share a pooled module-level session.
 """
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional, Tuple
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from ._jsonlib import dumps, has_orjson, loads
+from .transport import DEFAULT_POOL_SIZE, HttpxSession, Urllib3Session, default_retry
 
 
 DEFAULT_BASE_URL = "https://app.usesend.com"
 
+_default_session: Optional[requests.Session] = None
+_default_session_lock = threading.Lock()
+
+
+def _build_default_session() -> requests.Session:
+    """Create a session with a keep-alive pool and conservative retries.
+
+    The session is shared by clients using different API keys, so it never
+    stores cookies that one client's responses set.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=DEFAULT_POOL_SIZE,
+        pool_maxsize=DEFAULT_POOL_SIZE,
+        max_retries=default_retry(),
+    )
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_default_session() -> requests.Session:
+    """Return the process-wide session shared by clients without their own."""
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = _build_default_session()
+    return _default_session
+
 
 class UseSendHTTPError(Exception):
     """HTTP error raised when ``raise_on_error=True`` and a request fails."""
 
+    __slots__ = ("status_code", "error", "method", "path")
+
     def __init__(self, status_code: int, error: Dict[str, Any], method: str, path: str) -> None:
         self.status_code = status_code
         self.error = error
         self.method = method
         self.path = path
-        super().__init__(self.__str__())
+        super().__init__(self._format())
 
-    def __str__(self) -> str:  # pragma: no cover - presentation only
+    def _format(self) -> str:
         code = self.error.get("code", "UNKNOWN_ERROR")
         message = self.error.get("message", "")
         return f"{self.method} {self.path} -> {self.status_code} {code}: {message}"
 
+    def __str__(self) -> str:  # pragma: no cover - presentation only
+        # Formatted once in __init__ and kept as the exception argument.
+        return self.args[0] if self.args else self._format()
+
 
 class UseSend:
     """UseSend API client.
@@ -41,6 +85,14 @@ class UseSend:
         read ``USESEND_API_KEY`` or ``UNSEND_API_KEY`` from the environment.
     url:
         Optional base URL for the API (useful for testing).
+    session:
+        Optional ``requests.Session`` (or compatible object such as
+        :class:`usesend.transport.Urllib3Session`) used to send requests.
+        Defaults to a pooled session shared by all clients. Any object with
+        ``request(method, url, headers=..., json=...)`` works; it must also
+        accept ``data=`` if you pass pre-encoded ``bytes`` bodies. Responses
+        need ``ok``, ``status_code``, ``reason`` and ``json()``; a ``content``
+        attribute with the raw body is used when present.
     """
 
     def __init__(
@@ -66,7 +118,12 @@ class UseSend:
         }
 
         self.raise_on_error = raise_on_error
-        self._session = session or requests.Session()
+        self._session = session or _get_default_session()
+        # Sessions known to accept ``data=`` get bodies encoded up front;
+        # other duck-typed sessions keep receiving ``json=``.
+        self._sends_bytes = isinstance(
+            self._session, (requests.Session, Urllib3Session, HttpxSession)
+        )
 
         # Lazily initialise resource clients.
         self.emails = Emails(self)
@@ -79,13 +136,16 @@ class UseSend:
     # ------------------------------------------------------------------
     # Webhooks
     # ------------------------------------------------------------------
-    def webhooks(self, secret: str) -> "Webhooks":
+    def webhooks(self, secret: str, *, tolerance: Optional[int] = None) -> "Webhooks":
         """Create a Webhooks instance for verifying webhook signatures.
 
         Parameters
         ----------
         secret:
             The webhook signing secret (starts with 'whsec_').
+        tolerance:
+            Optional default tolerance in milliseconds for timestamp
+            validation. Defaults to 5 minutes.
 
         Returns
         -------
@@ -102,15 +162,20 @@ class UseSend:
         event = webhooks.construct_event(body, headers=request.headers)
         ```
         """
-        return Webhooks(secret)
+        if tolerance is None:
+            return Webhooks(secret)
+        return Webhooks(secret, tolerance=tolerance)
 
     # ------------------------------------------------------------------
     # Internal request helper
     # ------------------------------------------------------------------
     def _build_headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        # Shared, not copied, when there is nothing to merge; requests never
+        # mutates the headers mapping it is given.
+        if not extra:
+            return self.headers
         headers = dict(self.headers)
-        if extra:
-            headers.update({k: v for k, v in extra.items() if v is not None})
+        headers.update({k: v for k, v in extra.items() if v is not None})
         return headers
 
     def _request(
@@ -119,30 +184,92 @@ class UseSend:
         path: str,
         json: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
+        *,
+        raise_on_error: Optional[bool] = None,
     ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
-        """Perform an HTTP request and return ``(data, error)``."""
-        resp = self._session.request(
-            method,
-            f"{self.url}{path}",
-            headers=self._build_headers(headers),
-            json=json,
-        )
-        default_error = {"code": "INTERNAL_SERVER_ERROR", "message": resp.reason}
+        """Perform an HTTP request and return ``(data, error)``.
 
+        ``json`` may be a JSON-serializable object or an already encoded
+        ``bytes`` body, which is sent as-is. ``raise_on_error`` overrides the
+        client setting for this call.
+        """
+        url = self.url + path
+        body = _encode_json(json) if self._sends_bytes or isinstance(json, bytes) else None
+        if body is None:
+            resp = self._session.request(
+                method,
+                url,
+                headers=self._build_headers(headers),
+                json=json,
+            )
+        else:
+            resp = self._session.request(
+                method,
+                url,
+                headers=self._build_headers(headers),
+                data=body,
+            )
         if not resp.ok:
             try:
-                payload = resp.json()
-                error = payload.get("error", default_error)
-            except Exception:
-                error = default_error
-            if self.raise_on_error:
+                payload = _decode_json(resp)
+                error = payload["error"] if "error" in payload else _default_error(resp)
+            except (ValueError, TypeError):
+                error = _default_error(resp)
+            if self.raise_on_error if raise_on_error is None else raise_on_error:
                 raise UseSendHTTPError(resp.status_code, error, method, path)
             return None, error
 
         try:
-            return resp.json(), None
-        except Exception:
-            return None, default_error
+            return _decode_json(resp), None
+        except ValueError:
+            return None, _default_error(resp)
+
+    # ------------------------------------------------------------------
+    # Concurrent requests
+    # ------------------------------------------------------------------
+    def execute_many(
+        self,
+        calls: Iterable[Sequence[Any]],
+        *,
+        max_workers: int = DEFAULT_POOL_SIZE,
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """Run independent requests concurrently over the pooled session.
+
+        Parameters
+        ----------
+        calls:
+            ``(method, path)`` or ``(method, path, body)`` sequences.
+        max_workers:
+            Number of requests in flight at once. Keep it at or below the
+            session's connection pool size (10 for the default session) so
+            every worker gets a kept-alive connection.
+
+        Returns
+        -------
+        list
+            ``(data, error)`` per call, in input order. Failed calls are
+            reported as errors and never raised, whatever ``raise_on_error``
+            is, so one failure cannot hide the outcome of the other calls.
+
+        Example
+        -------
+        ```python
+        results = client.execute_many([
+            ("POST", "/contactBooks/cb_123/contacts", {"email": "a@example.com"}),
+            ("GET", "/domains"),
+        ])
+        ```
+        """
+        calls = list(calls)
+        if len(calls) <= 1 or max_workers <= 1:
+            return [self._request(*call, raise_on_error=False) for call in calls]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            return list(
+                executor.map(lambda call: self._request(*call, raise_on_error=False), calls)
+            )
 
     # ------------------------------------------------------------------
     # HTTP verb helpers
@@ -185,6 +312,38 @@ class UseSend:
         return self._request("DELETE", path, json=body, headers=headers)
 
 
+def _default_error(resp: requests.Response) -> Dict[str, Any]:
+    """Fallback error used when the response carries no ``error`` payload.
+
+    Built on demand so successful requests do not allocate it.
+    """
+    return {"code": "INTERNAL_SERVER_ERROR", "message": resp.reason}
+
+
+def _decode_json(resp: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson on the raw bytes if available.
+
+    Responses from duck-typed sessions without ``content`` use ``json()``.
+    """
+    content = getattr(resp, "content", None)
+    if has_orjson() and content is not None:
+        return loads(content)
+    return resp.json()
+
+
+def _encode_json(body: Any) -> Optional[bytes]:
+    """Encode a request body to JSON bytes in a single pass.
+
+    Returns ``None`` when there is no body, or when orjson is not installed
+    and ``requests`` should encode it with the standard library instead.
+    """
+    if body is None or isinstance(body, bytes):
+        return body
+    if has_orjson():
+        return dumps(body)
+    return None
+
+
 # Import here to avoid circular dependency during type checking
 from .emails import Emails  # noqa: E402  pylint: disable=wrong-import-position
 from .contacts import Contacts  # noqa: E402  pylint: disable=wrong-import-position
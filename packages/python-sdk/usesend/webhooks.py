@@ -8,10 +8,12 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
+import threading
 import time
-from typing import Any, Dict, Literal, Mapping, Optional, Union
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Tuple, Union
 
+from ._jsonlib import loads
 from .types import WebhookEventData
 
 
@@ -21,12 +23,23 @@ WEBHOOK_TIMESTAMP_HEADER = "X-UseSend-Timestamp"
 WEBHOOK_EVENT_HEADER = "X-UseSend-Event"
 WEBHOOK_CALL_HEADER = "X-UseSend-Call"
 
+_SIGNATURE_HEADER_LOWER = WEBHOOK_SIGNATURE_HEADER.lower()
+_TIMESTAMP_HEADER_LOWER = WEBHOOK_TIMESTAMP_HEADER.lower()
+
 # Signature format
 SIGNATURE_PREFIX = "v1="
+SIGNATURE_HEX_LENGTH = hashlib.sha256().digest_size * 2
 
 # Default tolerance: 5 minutes in milliseconds
 DEFAULT_TOLERANCE_MS = 5 * 60 * 1000
 
+# Keyed HMAC states kept per instance for per-call secret overrides
+_OVERRIDE_MAC_CACHE_SIZE = 4
+
+# Default number of recently verified deliveries remembered per instance;
+# the replay cache is opt-in
+DEFAULT_CACHE_SIZE = 0
+
 
 WebhookVerificationErrorCode = Literal[
     "MISSING_SIGNATURE",
@@ -48,6 +61,8 @@ class WebhookVerificationError(Exception):
         message: A human-readable description of the error.
     """
 
+    __slots__ = ("code", "message")
+
     def __init__(self, code: WebhookVerificationErrorCode, message: str) -> None:
         self.code = code
         self.message = message
@@ -67,6 +82,15 @@ class Webhooks:
     ----------
     secret:
         The webhook signing secret (starts with 'whsec_').
+    tolerance:
+        Default tolerance in milliseconds for timestamp validation, used when
+        a call does not pass its own. Defaults to 5 minutes. Set to -1 to
+        disable timestamp validation.
+    cache_size:
+        Number of recently verified deliveries to remember. A retried delivery
+        with the same timestamp, signature and body skips the HMAC. The
+        timestamp tolerance still applies. Disabled (0) by default, since
+        checking the cache adds cost to every new delivery.
 
     Example
     -------
@@ -94,8 +118,26 @@ class Webhooks:
     ```
     """
 
-    def __init__(self, secret: str) -> None:
-        self._secret = secret
+    def __init__(
+        self,
+        secret: str,
+        *,
+        tolerance: int = DEFAULT_TOLERANCE_MS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self._tolerance = tolerance
+        # Keyed HMAC state is reused via ``copy()`` so the key schedule is
+        # only computed once per instance.
+        self._mac = _new_mac(secret)
+        # Same for a few recent per-call ``secret`` overrides, which live only
+        # as long as this instance.
+        self._override_macs: Dict[str, "hmac.HMAC"] = {}
+        # LRU of (timestamp, digest) -> body for deliveries verified with the
+        # instance secret; the lock (also used for the override MACs) guards
+        # both for threaded servers.
+        self._cache_size = cache_size
+        self._seen: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._seen_lock = threading.Lock()
 
     def verify(
         self,
@@ -117,7 +159,8 @@ class Webhooks:
             Optional override for the webhook secret.
         tolerance:
             Optional tolerance in milliseconds for timestamp validation.
-            Defaults to 5 minutes. Set to -1 to disable timestamp validation.
+            Defaults to the instance tolerance (5 minutes unless configured).
+            Set to -1 to disable timestamp validation.
 
         Returns
         -------
@@ -139,6 +182,48 @@ class Webhooks:
         except WebhookVerificationError:
             return False
 
+    def verify_batch(
+        self,
+        items: Iterable[Tuple[Union[str, bytes], Mapping[str, Any]]],
+        *,
+        secret: Optional[str] = None,
+        tolerance: Optional[int] = None,
+    ) -> List[bool]:
+        """Verify a batch of webhook signatures without parsing the events.
+
+        Equivalent to calling :meth:`verify` on each item, which is convenient
+        when deliveries are drained from a queue. Each item's timestamp is
+        checked against the time at which that item is verified.
+
+        Parameters
+        ----------
+        items:
+            Iterable of ``(body, headers)`` pairs.
+        secret:
+            Optional override for the webhook secret.
+        tolerance:
+            Optional tolerance in milliseconds for timestamp validation.
+            Defaults to the instance tolerance (5 minutes unless configured).
+            Set to -1 to disable timestamp validation.
+
+        Returns
+        -------
+        List[bool]
+            One result per item, in input order.
+
+        Example
+        -------
+        ```python
+        results = webhooks.verify_batch(
+            (message.body, message.headers) for message in messages
+        )
+        ```
+        """
+        return [
+            self.verify(body, headers=headers, secret=secret, tolerance=tolerance)
+            for body, headers in items
+        ]
+
     def construct_event(
         self,
         body: Union[str, bytes],
@@ -159,7 +244,8 @@ class Webhooks:
             Optional override for the webhook secret.
         tolerance:
             Optional tolerance in milliseconds for timestamp validation.
-            Defaults to 5 minutes. Set to -1 to disable timestamp validation.
+            Defaults to the instance tolerance (5 minutes unless configured).
+            Set to -1 to disable timestamp validation.
 
         Returns
         -------
@@ -199,12 +285,13 @@ class Webhooks:
             print(event["data"]["bounce"]["type"])
         ```
         """
-        self._verify_internal(body, headers=headers, secret=secret, tolerance=tolerance)
+        body_bytes = self._verify_internal(
+            body, headers=headers, secret=secret, tolerance=tolerance
+        )
 
-        body_string = _to_string(body)
         try:
-            return json.loads(body_string)
-        except (json.JSONDecodeError, ValueError) as e:
+            return loads(body_bytes)
+        except ValueError as e:
             raise WebhookVerificationError(
                 "INVALID_JSON",
                 f"Webhook payload is not valid JSON: {e}",
@@ -217,11 +304,13 @@ class Webhooks:
         headers: Mapping[str, Any],
         secret: Optional[str] = None,
         tolerance: Optional[int] = None,
-    ) -> None:
-        """Internal verification logic."""
-        webhook_secret = secret if secret is not None else self._secret
-        signature = _get_header(headers, WEBHOOK_SIGNATURE_HEADER)
-        timestamp = _get_header(headers, WEBHOOK_TIMESTAMP_HEADER)
+    ) -> bytes:
+        """Internal verification logic.
+
+        Returns the verified body as bytes so callers can parse it without
+        converting the original body again.
+        """
+        signature, timestamp = _get_signature_headers(headers)
 
         if not signature:
             raise WebhookVerificationError(
@@ -249,8 +338,10 @@ class Webhooks:
                 "Timestamp header must be a number (milliseconds since epoch)",
             ) from e
 
-        tolerance_ms = tolerance if tolerance is not None else DEFAULT_TOLERANCE_MS
-        now = int(time.time() * 1000)
+        # Reject stale or future timestamps before hashing the body so replayed
+        # deliveries cost an integer compare rather than a full HMAC.
+        tolerance_ms = tolerance if tolerance is not None else self._tolerance
+        now = time.time_ns() // 1_000_000
 
         if tolerance_ms >= 0 and abs(now - timestamp_num) > tolerance_ms:
             raise WebhookVerificationError(
@@ -258,69 +349,152 @@ class Webhooks:
                 "Webhook timestamp is outside the allowed tolerance",
             )
 
-        body_string = _to_string(body)
-        expected = _compute_signature(webhook_secret, timestamp, body_string)
+        body_bytes = _to_bytes(body)
+        provided = _decode_signature(signature)
+        if provided is None:
+            raise WebhookVerificationError(
+                "SIGNATURE_MISMATCH",
+                "Webhook signature does not match",
+            )
+
+        cache_key: Optional[Tuple[str, bytes]] = None
+        if secret is None and self._cache_size > 0:
+            cache_key = (timestamp, provided)
+        if cache_key is not None and self._seen_before(cache_key, body_bytes):
+            return body_bytes
 
-        if not _safe_compare(expected, signature):
+        mac = self._mac if secret is None else self._override_mac(secret)
+        expected = _compute_signature(mac.copy(), timestamp, body_bytes)
+
+        if not hmac.compare_digest(expected, provided):
             raise WebhookVerificationError(
                 "SIGNATURE_MISMATCH",
                 "Webhook signature does not match",
             )
 
+        if cache_key is not None:
+            self._remember(cache_key, body_bytes)
+        return body_bytes
+
+    def _override_mac(self, secret: str) -> "hmac.HMAC":
+        """Keyed HMAC template for a per-call secret; callers must ``copy()`` it."""
+        mac = self._override_macs.get(secret)
+        if mac is None:
+            mac = _new_mac(secret)
+            with self._seen_lock:
+                if len(self._override_macs) >= _OVERRIDE_MAC_CACHE_SIZE:
+                    del self._override_macs[next(iter(self._override_macs))]
+                self._override_macs[secret] = mac
+        return mac
+
+    def _seen_before(self, key: Tuple[str, bytes], body: bytes) -> bool:
+        """Return True if this exact delivery was already verified."""
+        with self._seen_lock:
+            cached = self._seen.get(key)
+            if cached is None or cached != body:
+                return False
+            self._seen.move_to_end(key)
+            return True
+
+    def _remember(self, key: Tuple[str, bytes], body: bytes) -> None:
+        """Record a verified delivery, evicting the least recently used."""
+        with self._seen_lock:
+            self._seen[key] = body
+            self._seen.move_to_end(key)
+            if len(self._seen) > self._cache_size:
+                self._seen.popitem(last=False)
+
+
+def _new_mac(secret: str) -> "hmac.HMAC":
+    """Create a keyed HMAC-SHA256 object with no message data."""
+    return hmac.new(secret.encode("utf-8"), None, hashlib.sha256)
+
+
+def _compute_signature(mac: "hmac.HMAC", timestamp: str, body: bytes) -> bytes:
+    """Compute the raw HMAC-SHA256 digest for webhook verification.
+
+    ``mac`` must be a freshly keyed HMAC; it is updated in place. The signed
+    message is ``{timestamp}.{body}``; its parts are fed to the HMAC
+    separately so the body is never copied into a joined string.
+    """
+    mac.update(timestamp.encode("utf-8"))
+    mac.update(b".")
+    mac.update(body)
+    return mac.digest()
+
 
-def _compute_signature(secret: str, timestamp: str, body: str) -> str:
-    """Compute the HMAC-SHA256 signature for webhook verification."""
-    message = f"{timestamp}.{body}"
-    signature = hmac.new(
-        secret.encode("utf-8"),
-        message.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    return f"{SIGNATURE_PREFIX}{signature}"
+def _decode_signature(signature: str) -> Optional[bytes]:
+    """Decode a ``v1=<hex>`` header into raw digest bytes.
+
+    Returns ``None`` when the hex part is not a 32-byte SHA-256 digest.
+    """
+    hex_digest = signature[len(SIGNATURE_PREFIX):]
+    if len(hex_digest) != SIGNATURE_HEX_LENGTH:
+        return None
+    try:
+        return bytes.fromhex(hex_digest)
+    except ValueError:
+        return None
 
 
-def _to_string(body: Union[str, bytes]) -> str:
-    """Convert body to UTF-8 string."""
+def _to_bytes(body: Union[str, bytes]) -> bytes:
+    """Return the raw UTF-8 bytes of the body, validating bytes input."""
     if isinstance(body, str):
-        return body
+        return body.encode("utf-8")
     if isinstance(body, bytes):
+        # ASCII is valid UTF-8; only non-ASCII bodies need a validating decode.
+        if body.isascii():
+            return body
         try:
-            return body.decode("utf-8")
+            body.decode("utf-8")
         except UnicodeDecodeError as e:
             raise WebhookVerificationError(
                 "INVALID_BODY",
                 "Webhook body must be valid UTF-8.",
             ) from e
+        return body
     raise WebhookVerificationError(
         "INVALID_BODY",
         f"Unsupported body type: {type(body).__name__}. Expected str or bytes.",
     )
 
 
-def _get_header(headers: Mapping[str, Any], name: str) -> Optional[str]:
-    """Get header value in a case-insensitive manner."""
-    if headers is None:
-        return None
-
-    # Try direct access first
-    if name in headers:
-        value = headers[name]
-        if isinstance(value, list):
-            return value[0] if value else None
-        return str(value) if value is not None else None
-
-    # Case-insensitive lookup
-    lower_name = name.lower()
-    for key in headers:
-        if key.lower() == lower_name:
-            value = headers[key]
-            if isinstance(value, list):
-                return value[0] if value else None
-            return str(value) if value is not None else None
+def _get_signature_headers(
+    headers: Mapping[str, Any],
+) -> Tuple[Optional[str], Optional[str]]:
+    """Get the signature and timestamp headers in a case-insensitive manner.
 
-    return None
-
-
-def _safe_compare(a: str, b: str) -> bool:
-    """Timing-safe string comparison to prevent timing attacks."""
-    return hmac.compare_digest(a.encode("utf-8"), b.encode("utf-8"))
+    Both names are probed with ``get`` in canonical and lowercase form, which
+    is O(1) for plain dicts (e.g. ``dict(request.headers)``) and for the
+    case-insensitive header types of Flask, Django, Starlette and requests.
+    Only if a header is still missing are the headers scanned once.
+    """
+    if headers is None:
+        return None, None
+
+    signature: Any = headers.get(WEBHOOK_SIGNATURE_HEADER)
+    if signature is None:
+        signature = headers.get(_SIGNATURE_HEADER_LOWER)
+    timestamp: Any = headers.get(WEBHOOK_TIMESTAMP_HEADER)
+    if timestamp is None:
+        timestamp = headers.get(_TIMESTAMP_HEADER_LOWER)
+    if signature is not None and timestamp is not None:
+        return _header_value(signature), _header_value(timestamp)
+
+    for key, value in headers.items():
+        lower_key = key.lower()
+        if lower_key == _SIGNATURE_HEADER_LOWER:
+            if signature is None:
+                signature = value
+        elif lower_key == _TIMESTAMP_HEADER_LOWER:
+            if timestamp is None:
+                timestamp = value
+
+    return _header_value(signature), _header_value(timestamp)
+
+
+def _header_value(value: Any) -> Optional[str]:
+    """Normalize a header value that may be a list of values."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return str(value) if value is not None else None